@@ -25,3 +25,7 @@ def download(url : str, download_file_path : str) -> Commands:
 
 def set_timeout(timeout : int) -> Commands:
 	return [ '--connect-timeout', str(timeout) ]
+
+
+def set_max_filesize(max_filesize : int) -> Commands:
+	return [ '--max-filesize', str(max_filesize) ]
@@ -19,7 +19,7 @@ def run_ffmpeg_with_progress(commands : Commands, update_progress : UpdateProgre
 	commands.extend(ffmpeg_builder.set_progress())
 	commands.extend(ffmpeg_builder.cast_stream())
 	commands = ffmpeg_builder.run(commands)
-	process = subprocess.Popen(commands, stderr = subprocess.PIPE, stdout = subprocess.PIPE)
+	process = subprocess.Popen(commands, stdin = subprocess.DEVNULL, stderr = subprocess.PIPE, stdout = subprocess.PIPE)
 
 	while process_manager.is_processing():
 		try:
@@ -48,7 +48,7 @@ def update_progress(progress : tqdm, frame_number : int) -> None:
 def run_ffmpeg(commands : Commands) -> subprocess.Popen[bytes]:
 	log_level = state_manager.get_item('log_level')
 	commands = ffmpeg_builder.run(commands)
-	process = subprocess.Popen(commands, stderr = subprocess.PIPE, stdout = subprocess.PIPE)
+	process = subprocess.Popen(commands, stdin = subprocess.DEVNULL, stderr = subprocess.PIPE, stdout = subprocess.PIPE)
 
 	while process_manager.is_processing():
 		try:
@@ -1,5 +1,6 @@
 import itertools
 import shutil
+from functools import lru_cache
 from typing import Optional
 
 import numpy
@@ -8,8 +9,13 @@ from facefusion.filesystem import get_file_format
 from facefusion.types import AudioEncoder, Commands, Duration, Fps, StreamMode, VideoEncoder, VideoPreset
 
 
+@lru_cache(maxsize = None)
+def resolve_ffmpeg_path() -> Optional[str]:
+	return shutil.which('ffmpeg')
+
+
 def run(commands : Commands) -> Commands:
-	return [ shutil.which('ffmpeg'), '-loglevel', 'error' ] + commands
+	return [ resolve_ffmpeg_path(), '-loglevel', 'error' ] + commands
 
 
 def chain(*commands : Commands) -> Commands:
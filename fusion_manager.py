@@ -4,8 +4,10 @@ FaceFusion Manager - Core processing logic
 Handles FaceFusion initialization and face swap processing
 """
 
-from facefusion.filesystem import is_image, is_video
-from facefusion.download import conditional_download
+import facefusion.choices
+from facefusion import curl_builder
+from facefusion.filesystem import get_file_format, get_file_size, is_image, is_video, remove_file
+from facefusion.download import get_static_download_size, open_curl
 from facefusion.core import conditional_process
 from facefusion import state_manager
 from facefusion.vision import detect_image_resolution, detect_video_resolution
@@ -20,6 +22,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 import logging
 from datetime import datetime
+from urllib.parse import urlparse
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent
@@ -30,6 +33,11 @@ sys.path.insert(0, str(PROJECT_ROOT))
 # Configure logging
 logger = logging.getLogger("FaceFusion-Manager")
 
+# Upper bound for user supplied source/target downloads
+MAX_DOWNLOAD_SIZE = int(os.getenv('MAX_DOWNLOAD_SIZE', 50 * 1024 * 1024))
+# Target videos are much larger than images and get their own limit
+MAX_VIDEO_DOWNLOAD_SIZE = int(os.getenv('MAX_VIDEO_DOWNLOAD_SIZE', 500 * 1024 * 1024))
+
 
 # ============================================================================
 # Request/Response Models
@@ -150,10 +158,12 @@ def headless_conditional_process(sources, target, output, resolution, face_swapp
         'job_id', 'job_status', 'step_index'
     ]
     
-    for key in all_keys:
-        value = state_manager.get_item(key)
-        if value is not None:
-            logger.info(f"{key}: {value}")
+    # Runs for every job: skip the lookups and formatting when INFO is filtered out
+    if logger.isEnabledFor(logging.INFO):
+        for key in all_keys:
+            value = state_manager.get_item(key)
+            if value is not None:
+                logger.info("%s: %s", key, value)
     
     # Verify critical configuration is loaded
     processors = state_manager.get_item('processors')
@@ -162,11 +172,11 @@ def headless_conditional_process(sources, target, output, resolution, face_swapp
     
     # Process
     logger.info(f"Starting conditional_process...")
-    logger.info(f"DISABLE_NSFW_CHECK={os.environ.get('DISABLE_NSFW_CHECK', 'not set')}")
+    logger.info("DISABLE_NSFW_CHECK=%s", os.environ.get('DISABLE_NSFW_CHECK', 'not set'))
     
     try:
         error_code = conditional_process()
-        logger.info(f"conditional_process returned: {error_code}")
+        logger.info("conditional_process returned: %s", error_code)
         return error_code
     except Exception as e:
         logger.error(f"Exception in conditional_process: {str(e)}")
@@ -174,6 +184,44 @@ def headless_conditional_process(sources, target, output, resolution, face_swapp
         raise
 
 
+def get_download_size_limit(download_file_path: str) -> int:
+    """Return the size limit for a download based on its file format"""
+    if get_file_format(download_file_path) in facefusion.choices.video_formats:
+        return MAX_VIDEO_DOWNLOAD_SIZE
+    return MAX_DOWNLOAD_SIZE
+
+
+def download_input_file(download_directory_path: str, url: str) -> None:
+    """Download a user supplied file, aborting once it exceeds the size limit"""
+    download_file_path = os.path.join(download_directory_path, os.path.basename(urlparse(url).path))
+    size_limit = get_download_size_limit(download_file_path)
+
+    # Content-Length from HEAD is only a fast early rejection, the host can still send more on GET
+    download_size = get_static_download_size(url)
+    if download_size > size_limit:
+        raise ValueError(f"File too large: {url} ({download_size} bytes, limit {size_limit} bytes)")
+
+    commands = curl_builder.chain(
+        curl_builder.download(url, download_file_path),
+        curl_builder.set_timeout(10),
+        curl_builder.set_max_filesize(size_limit)
+    )
+    process = open_curl(commands)
+
+    # Older curl only honours --max-filesize for a known Content-Length, so also watch the file
+    while process.poll() is None:
+        if get_file_size(download_file_path) > size_limit:
+            process.terminate()
+            process.wait()
+            break
+        time.sleep(0.1)
+
+    # curl exits with 63 when the maximum file size is exceeded
+    if process.returncode == 63 or get_file_size(download_file_path) > size_limit:
+        remove_file(download_file_path)
+        raise ValueError(f"File too large: {url} (limit {size_limit} bytes)")
+
+
 # ============================================================================
 # FaceFusion Manager
 # ============================================================================
@@ -240,7 +288,7 @@ class FaceFusionManager:
         
     async def process_face_swap(self, request: ProcessRequest) -> ProcessResponse:
         """Process a face swap request"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         job_id = str(uuid.uuid4())[:8]
         temp_dir = tempfile.mkdtemp(prefix="facefusion_")
         
@@ -252,7 +300,7 @@ class FaceFusionManager:
             state_manager.set_item('download_providers', ['github', 'huggingface'])
             state_manager.set_item('log_level', 'info')
             
-            conditional_download(temp_dir, [request.source_url])
+            download_input_file(temp_dir, request.source_url)
             source_files = os.listdir(temp_dir)
             if not source_files:
                 raise FileNotFoundError(f"Failed to download source file from {request.source_url}")
@@ -260,7 +308,7 @@ class FaceFusionManager:
             
             # Download target file
             logger.info("Downloading target file...")
-            conditional_download(temp_dir, [request.target_url])
+            download_input_file(temp_dir, request.target_url)
             all_files = os.listdir(temp_dir)
             target_files = [f for f in all_files if f not in source_files]
             if not target_files:
@@ -307,7 +355,7 @@ class FaceFusionManager:
                 face_swapper_model=request.model
             )
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             if error_code == 0 and os.path.exists(output_path):
                 # Copy to outputs directory
@@ -315,7 +363,7 @@ class FaceFusionManager:
                 os.makedirs(os.path.dirname(final_output_path), exist_ok=True)
                 shutil.copy2(output_path, final_output_path)
                 
-                logger.info(f"Job {job_id} completed successfully in {processing_time:.2f}s")
+                logger.info("Job %s completed successfully in %.2fs", job_id, processing_time)
                 
                 return ProcessResponse(
                     status="success",
@@ -334,7 +382,7 @@ class FaceFusionManager:
                 raise Exception(error_msg)
                 
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             error_msg = str(e)
             logger.error(f"Job {job_id} failed: {error_msg}")
             logger.error(traceback.format_exc())
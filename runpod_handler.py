@@ -21,15 +21,34 @@ from fusion_manager import FaceFusionManager, ProcessRequest
 PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+
+def setup_logging(level: str = "INFO") -> None:
+    """配置中文化的日志系统，调用方已配置根日志时保留其处理器"""
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=getattr(logging, level.upper()),
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            handlers=[logging.StreamHandler(sys.stdout)]
+        )
+    
+    # 调整第三方库日志级别
+    logging.getLogger('urllib3').setLevel(logging.WARNING)
+    logging.getLogger('facefusion').setLevel(logging.INFO)
+
+
+# 日志系统需在可选依赖检查之前就绪
+setup_logging()
+logger = logging.getLogger(__name__)
+
 # 可选依赖检查
 try:
     import runpod
     RUNPOD_AVAILABLE = True
-    print("✅ RunPod SDK 导入成功")
+    logger.info("✅ RunPod SDK 导入成功")
 except ImportError as e:
     RUNPOD_AVAILABLE = False
-    print(f"❌ RunPod SDK 导入失败: {e}")
-    print("💡 如果在 Docker 容器中，请确保 requirements.txt 中包含 runpod")
+    logger.warning(f"❌ RunPod SDK 导入失败: {e}")
+    logger.warning("💡 如果在 Docker 容器中，请确保 requirements.txt 中包含 runpod")
 
 # ============================================================================
 # 全局管理器实例
@@ -149,28 +168,11 @@ def health_check() -> Dict[str, Any]:
         }
 
 
-def setup_logging(level: str = "INFO") -> None:
-    """配置中文化的日志系统"""
-    logging.basicConfig(
-        level=getattr(logging, level.upper()),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[logging.StreamHandler(sys.stdout)]
-    )
-    
-    # 调整第三方库日志级别
-    logging.getLogger('urllib3').setLevel(logging.WARNING)
-    logging.getLogger('facefusion').setLevel(logging.INFO)
-
-
 # ============================================================================
 # 主程序入口
 # ============================================================================
 
 if __name__ == "__main__":
-    # 设置日志系统
-    setup_logging()
-    logger = logging.getLogger(__name__)
-    
     # 本地测试模式
     if len(sys.argv) > 1 and '--test' in sys.argv:
         logger.info("🧪 启动本地测试模式...")
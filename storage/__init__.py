@@ -6,6 +6,7 @@
 from .manager import StorageManager, initialize_storage, get_storage_manager, set_storage_manager
 from .base import StorageProvider
 from .auth import init_google_cloud_auth, init_all_auth
+from .download import download_parallel
 
 __all__ = [
     'StorageManager',
@@ -14,5 +15,6 @@ __all__ = [
     'get_storage_manager',
     'set_storage_manager',
     'init_google_cloud_auth',
-    'init_all_auth'
+    'init_all_auth',
+    'download_parallel'
 ]
\ No newline at end of file
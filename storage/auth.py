@@ -20,9 +20,15 @@ def init_google_cloud_auth():
         credentials_base64 = os.getenv('GOOGLE_CREDENTIALS_BASE64')
         credentials_path = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
         
+        # 凭据文件已存在且非空时直接复用，跳过 Base64 解码和 JSON 校验
+        if credentials_path and os.path.exists(credentials_path) and os.path.getsize(credentials_path) > 0:
+            logger.info(f"✅ 使用现有的 Google Cloud 认证文件: {credentials_path}")
+            return credentials_path
+
         if credentials_base64 and credentials_path:
             logger.info("🔧 解码 Base64 编码的 Google Cloud 凭据")
-            decoded = base64.b64decode(credentials_base64).decode("utf-8")
+            # 去掉换行等空白后再严格解码，兼容按行折断的 Base64 凭据
+            decoded = base64.b64decode(''.join(credentials_base64.split()), validate=True).decode("utf-8")
             
             # 验证 JSON 格式
             json.loads(decoded)
@@ -37,11 +43,6 @@ def init_google_cloud_auth():
             logger.info(f"✅ Google Cloud 认证文件已创建: {credentials_path}")
             return credentials_path
         
-        # 检查是否已经设置了 GOOGLE_APPLICATION_CREDENTIALS 且文件存在
-        if credentials_path and os.path.exists(credentials_path):
-            logger.info(f"✅ 使用现有的 Google Cloud 认证文件: {credentials_path}")
-            return credentials_path
-        
         logger.warning("⚠️ 未找到 Google Cloud 认证配置，GCS 存储功能可能受限")
         return None
         
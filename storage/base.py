@@ -1,9 +1,27 @@
 """
 存储提供商抽象基类
 """
+import asyncio
+import weakref
 from abc import ABC, abstractmethod
 
 
+# 限制同时进行的异步上传数量
+MAX_ASYNC_UPLOADS = 16
+
+# 信号量绑定首次等待它的事件循环，因此按事件循环分别创建
+_upload_semaphores = weakref.WeakKeyDictionary()
+
+
+def get_upload_semaphore() -> asyncio.Semaphore:
+    """获取当前事件循环的上传信号量（runpod_handler 每个任务都会新建事件循环）"""
+    loop = asyncio.get_running_loop()
+    semaphore = _upload_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _upload_semaphores[loop] = asyncio.Semaphore(MAX_ASYNC_UPLOADS)
+    return semaphore
+
+
 class StorageProvider(ABC):
     """存储提供商抽象基类"""
 
@@ -20,4 +38,9 @@ class StorageProvider(ABC):
     @abstractmethod
     def upload_base64(self, base64_data: str, destination_path: str) -> str:
         """上传base64数据，返回URL"""
-        pass
\ No newline at end of file
+        pass
+
+    async def upload_binary_async(self, binary_data: bytes, destination_path: str) -> str:
+        """异步上传二进制数据，返回URL；默认在线程中执行同步上传"""
+        async with get_upload_semaphore():
+            return await asyncio.to_thread(self.upload_binary, binary_data, destination_path)
\ No newline at end of file
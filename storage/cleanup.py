@@ -0,0 +1,27 @@
+"""
+本地文件清理工具 - 上传完成后在后台删除源文件
+"""
+import os
+import atexit
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+
+logger = logging.getLogger(__name__)
+
+_cleanup_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='storage-cleanup')
+atexit.register(_cleanup_pool.shutdown)
+
+
+def _remove_file(file_path: str):
+    """删除文件，失败时仅记录日志"""
+    try:
+        os.remove(file_path)
+        logger.info(f"Local file {file_path} deleted after upload")
+    except OSError as e:
+        logger.warning(f"删除本地文件失败 {file_path}: {e}")
+
+
+def remove_file_async(file_path: str):
+    """提交后台删除任务，不阻塞调用方"""
+    return _cleanup_pool.submit(_remove_file, file_path)
@@ -0,0 +1,39 @@
+"""
+存储数据编解码工具
+"""
+import binascii
+import re
+from io import BytesIO
+from typing import Iterator
+
+
+_WHITESPACE = re.compile(r'\s')
+
+
+def iter_base64_decode(base64_data: str, chunk_size: int = 4 * 1024 * 1024) -> Iterator[bytes]:
+    """
+    分块解码 base64 数据，内存占用与分块大小相关而非整体数据大小
+
+    Args:
+        base64_data: base64 字符串，支持 data URL 格式
+        chunk_size: 每次解码的字符数
+    """
+    # 含换行、回车、制表符等空白时分块边界会错位，先去除空白
+    if _WHITESPACE.search(base64_data):
+        base64_data = _WHITESPACE.sub('', base64_data)
+
+    # 跳过 data URL 前缀
+    start = base64_data.find(',') + 1
+    chunk_size -= chunk_size % 4
+
+    for offset in range(start, len(base64_data), chunk_size):
+        yield binascii.a2b_base64(base64_data[offset:offset + chunk_size])
+
+
+def decode_base64_to_buffer(base64_data: str) -> BytesIO:
+    """分块解码 base64 数据到内存缓冲区，返回已定位到开头的 BytesIO"""
+    buffer = BytesIO()
+    for chunk in iter_base64_decode(base64_data):
+        buffer.write(chunk)
+    buffer.seek(0)
+    return buffer
@@ -34,6 +34,7 @@ r2_account_id = os.getenv('R2_ACCOUNT_ID', '')
 r2_access_key = os.getenv('R2_ACCESS_KEY', '')
 r2_secret_key = os.getenv('R2_SECRET_KEY', '')
 r2_public_domain = os.getenv('R2_PUBLIC_DOMAIN', '')
+r2_shard_keys = get_env_bool('R2_SHARD_KEYS', False)  # 对象键添加哈希前缀以分散分区
 
 # Cloudflare Images 配置
 cf_images_account_id = os.getenv('CF_IMAGES_ACCOUNT_ID', '')
@@ -0,0 +1,111 @@
+"""
+并行下载工具 - 通过多个 HTTP Range 请求下载 GCS/R2 等存储上的文件
+"""
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def _download_range(session, url: str, fd: int, start: int, end: int, timeout: int):
+    """下载 [start, end] 字节区间并写入文件对应偏移"""
+    with session.get(url, headers={'Range': f'bytes={start}-{end}'}, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise RuntimeError(f"Server ignored range request: HTTP {response.status_code}")
+        offset = start
+        for chunk in response.iter_content(CHUNK_SIZE):
+            os.pwrite(fd, chunk, offset)
+            offset += len(chunk)
+
+
+def _write_response(response, dest_path: str):
+    """将完整响应体流式写入文件"""
+    with open(dest_path, 'wb') as f:
+        for chunk in response.iter_content(CHUNK_SIZE):
+            f.write(chunk)
+
+
+def _download_single(session, url: str, dest_path: str, timeout: int):
+    """不支持 Range 时的单连接流式下载"""
+    with session.get(url, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        _write_response(response, dest_path)
+
+
+def _parse_total_size(content_range: str) -> int:
+    """从 Content-Range（如 bytes 0-0/12345）中解析文件总大小，未知时返回 0"""
+    total = content_range.rpartition('/')[2].strip()
+    return int(total) if total.isdigit() else 0
+
+
+def download_parallel(url: str, dest_path: str, parts: int = 8, timeout: int = 60) -> str:
+    """
+    使用多个并发 Range 请求下载文件
+
+    Args:
+        url: 文件URL
+        dest_path: 本地保存路径
+        parts: 并发分段数
+        timeout: 单个请求超时时间（秒）
+
+    Returns:
+        本地保存路径
+    """
+    import requests
+
+    with requests.Session() as session:
+        os.makedirs(os.path.dirname(os.path.abspath(dest_path)), exist_ok=True)
+
+        # 预签名 URL 通常只对 GET 签名，HEAD 会被拒绝，因此用单字节 Range GET 探测总大小
+        try:
+            probe = session.get(url, headers={'Range': 'bytes=0-0'}, stream=True, timeout=timeout)
+        except requests.RequestException as e:
+            logger.debug(f"Range 探测失败，使用单连接下载: {url} ({e})")
+            _download_single(session, url, dest_path, timeout)
+            return dest_path
+
+        with probe:
+            if probe.status_code == 200:
+                # 服务器忽略 Range 直接返回完整内容，复用该响应避免重复下载
+                logger.debug(f"服务器不支持 Range，使用单连接下载: {url}")
+                _write_response(probe, dest_path)
+                return dest_path
+            size = _parse_total_size(probe.headers.get('Content-Range', '')) if probe.status_code == 206 else 0
+
+        if size < parts * CHUNK_SIZE:
+            logger.debug(f"使用单连接下载: {url}")
+            _download_single(session, url, dest_path, timeout)
+            return dest_path
+
+        adapter = requests.adapters.HTTPAdapter(pool_connections=parts, pool_maxsize=parts)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        part_size = -(-size // parts)
+        ranges = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+
+        fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            # 预分配文件空间，各分段直接写入对应偏移
+            if hasattr(os, 'posix_fallocate'):
+                os.posix_fallocate(fd, 0, size)
+            else:
+                os.ftruncate(fd, size)
+
+            with ThreadPoolExecutor(max_workers=parts) as executor:
+                futures = [
+                    executor.submit(_download_range, session, url, fd, start, end, timeout)
+                    for start, end in ranges
+                ]
+                for future in futures:
+                    future.result()
+        finally:
+            os.close(fd)
+
+    logger.info(f"并行下载完成: {url} -> {dest_path} ({size} bytes, {len(ranges)} parts)")
+    return dest_path
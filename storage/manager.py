@@ -13,6 +13,7 @@ from .config import (
     r2_access_key,
     r2_secret_key,
     r2_public_domain,
+    r2_shard_keys,
     cf_images_account_id,
     cf_images_api_token,
     cf_images_delivery_domain
@@ -123,9 +124,9 @@ class StorageManager:
         """配置本地存储提供商"""
         if storage_provider == 'local':
             try:
-                from .providers.local import LocalProvider
+                from .providers.local import get_local_provider
                 logger.debug(f"配置本地存储路径: {local_storage_path}")
-                local_provider = LocalProvider(local_storage_path)
+                local_provider = get_local_provider(local_storage_path)
                 self.register_provider('local', local_provider, is_default=True)
                 logger.info("✅ 本地存储提供商已配置")
             except Exception as e:
@@ -135,10 +136,10 @@ class StorageManager:
         """配置GCS提供商"""
         if storage_provider == 'gcs' and bucket_name:
             try:
-                from .providers.gcs import GCSProvider
+                from .providers.gcs import get_gcs_provider
                 logger.debug(f"配置 GCS bucket: {bucket_name}")
                 logger.debug(f"配置 GCS CDN URL: {cdn_url}")
-                gcs_provider = GCSProvider(bucket_name, cdn_url=cdn_url)
+                gcs_provider = get_gcs_provider(bucket_name, cdn_url=cdn_url)
                 self.register_provider('gcs', gcs_provider, is_default=(storage_provider == 'gcs'))
                 logger.info("✅ GCS provider configured")
             except ImportError:
@@ -150,14 +151,15 @@ class StorageManager:
         """配置Cloudflare R2提供商"""
         if storage_provider == 'r2' and all([r2_bucket_name, r2_account_id, r2_access_key, r2_secret_key]):
             try:
-                from .providers.cloudflare_r2 import CloudflareR2Provider
+                from .providers.cloudflare_r2 import get_r2_provider
                 logger.debug(f"配置 R2 bucket: {r2_bucket_name}")
-                r2_provider = CloudflareR2Provider(
+                r2_provider = get_r2_provider(
                         bucket_name=r2_bucket_name,
                         account_id=r2_account_id,
                         access_key=r2_access_key,
                         secret_key=r2_secret_key,
-                        public_domain=r2_public_domain
+                        public_domain=r2_public_domain,
+                        shard_keys=r2_shard_keys
                     )
                 self.register_provider('r2', r2_provider, is_default=(storage_provider == 'r2'))
                 logger.info("✅ Cloudflare R2 provider configured")
@@ -170,9 +172,9 @@ class StorageManager:
         """配置Cloudflare Images提供商"""
         if storage_provider == 'cf_images' and all([cf_images_account_id, cf_images_api_token]):
             try:
-                from .providers.cloudflare_images import CloudflareImagesProvider
+                from .providers.cloudflare_images import get_cf_images_provider
                 logger.debug(f"配置 Cloudflare Images Account ID: {cf_images_account_id}")
-                cf_images_provider = CloudflareImagesProvider(
+                cf_images_provider = get_cf_images_provider(
                         account_id=cf_images_account_id,
                         api_token=cf_images_api_token,
                         delivery_domain=cf_images_delivery_domain
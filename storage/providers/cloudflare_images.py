@@ -3,7 +3,10 @@ Cloudflare Images 存储提供商
 """
 import os
 import logging
+from functools import lru_cache
 from ..base import StorageProvider
+from ..cleanup import remove_file_async
+from ..retry import UploadHTTPError, retry_upload
 
 
 logger = logging.getLogger(__name__)
@@ -19,6 +22,9 @@ class CloudflareImagesProvider(StorageProvider):
             self.api_token = api_token
             self.base_url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/images/v1"
             self.delivery_domain = delivery_domain or f"https://imagedelivery.net/{account_id}"
+            # 预先拼好默认变体 URL 的前后缀，上传时只需拼接图片 ID
+            self._url_prefix = f"{self.delivery_domain}/"
+            self._url_suffix = "/public"
             self.session = requests.Session()
             self.session.headers.update({
                 "Authorization": f"Bearer {api_token}",
@@ -29,8 +35,11 @@ class CloudflareImagesProvider(StorageProvider):
 
     def _get_image_url(self, image_id: str, variant: str = "public") -> str:
         """获取图片的访问URL"""
-        return f"{self.delivery_domain}/{image_id}/{variant}"
+        if variant == "public":
+            return self._url_prefix + image_id + self._url_suffix
+        return f"{self._url_prefix}{image_id}/{variant}"
 
+    @retry_upload()
     def upload_file(self, source_file_name: str, destination_path: str) -> str:
         """上传文件到Cloudflare Images"""
         try:
@@ -40,6 +49,7 @@ class CloudflareImagesProvider(StorageProvider):
             logger.error(f"Failed to upload file to Cloudflare Images: {e}")
             raise
 
+    @retry_upload()
     def upload_binary(self, binary_data: bytes, destination_path: str) -> str:
         """上传二进制数据到Cloudflare Images"""
         logger.info(f"开始上传二进制数据到Cloudflare Images: {destination_path}")
@@ -82,17 +92,22 @@ class CloudflareImagesProvider(StorageProvider):
                     logger.info(f"Cloudflare Images上传成功: {url}")
 
                     if source_file_name and os.path.exists(source_file_name):
-                        os.remove(source_file_name)
-                        logger.info(f"Local file {source_file_name} deleted after upload")
+                        remove_file_async(source_file_name)
 
                     return url
                 else:
                     error_msg = result.get('errors', [{'message': 'Unknown error'}])[0]['message']
                     raise Exception(f"Cloudflare Images API error: {error_msg}")
             else:
-                raise Exception(f"HTTP {response.status_code}: {response.text}")
+                raise UploadHTTPError(response.status_code, response.text)
 
         except Exception as e:
             logger.error(f"Cloudflare Images上传失败: {str(e)}")
             logger.error(f"失败详情 - 路径: {destination_path}, 数据大小: {len(file_data)} bytes")
-            raise
\ No newline at end of file
+            raise
+
+
+@lru_cache(maxsize=8)
+def get_cf_images_provider(account_id: str, api_token: str, delivery_domain: str = None) -> CloudflareImagesProvider:
+    """按配置缓存 Cloudflare Images 提供商实例，复用 HTTP 会话"""
+    return CloudflareImagesProvider(account_id, api_token, delivery_domain)
@@ -2,41 +2,123 @@
 Cloudflare R2 存储提供商
 """
 import os
+import base64
+import hashlib
 import logging
+from functools import lru_cache
+from io import BytesIO
 from ..base import StorageProvider
+from ..codec import decode_base64_to_buffer
+from ..cleanup import remove_file_async
 
 
 logger = logging.getLogger(__name__)
 
+try:
+    import google_crc32c
+    CRC32C_AVAILABLE = True
+except ImportError:
+    CRC32C_AVAILABLE = False
+
+# 小于该大小的二进制数据单次 PUT 上传，否则分片上传
+MULTIPART_THRESHOLD = 16 * 1024 * 1024
+
+# 按扩展名预置的 Content-Type，避免每次上传时猜测 MIME 类型
+CONTENT_TYPES = {
+    '.mp4': 'video/mp4',
+    '.webm': 'video/webm',
+    '.mov': 'video/quicktime',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.webp': 'image/webp',
+    '.gif': 'image/gif'
+}
+
+
+def _get_content_type(path: str) -> str:
+    """根据目标路径扩展名返回 Content-Type"""
+    return CONTENT_TYPES.get(os.path.splitext(path)[1].lower(), 'application/octet-stream')
+
+
+# 按账号缓存的 S3 客户端
+_s3_clients = {}
+
+
+def _get_s3_client(account_id: str, access_key: str, secret_key: str):
+    """获取（或创建）共享的 S3 客户端，复用 HTTPS 连接池"""
+    cache_key = (account_id, access_key)
+    if cache_key not in _s3_clients:
+        import boto3
+        from botocore.config import Config
+
+        _s3_clients[cache_key] = boto3.client(
+            's3',
+            endpoint_url=f'https://{account_id}.r2.cloudflarestorage.com',
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            region_name='auto',
+            config=Config(
+                max_pool_connections=64,
+                # 瞬时错误由 botocore 自适应重试处理，上层不再叠加重试
+                retries={'mode': 'adaptive', 'max_attempts': 5},
+                tcp_keepalive=True,
+                signature_version='s3v4',
+                # 由调用方按需提供校验和，避免 botocore 再次完整扫描数据
+                request_checksum_calculation='when_required'
+            )
+        )
+    return _s3_clients[cache_key]
+
+
+def _shard_key(path: str) -> str:
+    """为对象键添加短哈希前缀，使写入分散到不同分区"""
+    shard = hashlib.blake2b(path.encode(), digest_size=2).hexdigest()
+    return f"{shard}/{path}"
+
 
 class CloudflareR2Provider(StorageProvider):
     """Cloudflare R2 存储提供商"""
 
-    def __init__(self, bucket_name: str, account_id: str, access_key: str, secret_key: str, public_domain: str = None):
+    def __init__(self, bucket_name: str, account_id: str, access_key: str, secret_key: str, public_domain: str = None,
+                 shard_keys: bool = False):
         try:
-            import boto3
-            self.s3_client = boto3.client(
-                's3',
-                endpoint_url=f'https://{account_id}.r2.cloudflarestorage.com',
-                aws_access_key_id=access_key,
-                aws_secret_access_key=secret_key,
-                region_name='auto'
-            )
+            from boto3.s3.transfer import TransferConfig
+            self.s3_client = _get_s3_client(account_id, access_key, secret_key)
             self.bucket_name = bucket_name
             self.public_domain = public_domain or f"https://pub-{account_id}.r2.dev"
+            self.shard_keys = shard_keys
+            # 大文件分片并发上传，失败时只重传单个分片
+            self.transfer_config = TransferConfig(
+                multipart_threshold=MULTIPART_THRESHOLD,
+                multipart_chunksize=MULTIPART_THRESHOLD,
+                max_concurrency=16,
+                use_threads=True
+            )
         except ImportError:
             raise ImportError("boto3 is required for Cloudflare R2 provider")
 
+    def _object_key(self, destination_path: str) -> str:
+        """根据配置返回实际写入的对象键"""
+        return _shard_key(destination_path) if self.shard_keys else destination_path
+
     def upload_file(self, source_file_name: str, destination_path: str) -> str:
         """上传文件到Cloudflare R2"""
+        object_key = self._object_key(destination_path)
+        extra_args = {'ContentType': _get_content_type(destination_path)}
         try:
-            self.s3_client.upload_file(source_file_name, self.bucket_name, destination_path)
-            logger.info(f"File {source_file_name} uploaded to R2: {destination_path}")
+            self.s3_client.upload_file(
+                source_file_name,
+                self.bucket_name,
+                object_key,
+                ExtraArgs=extra_args,
+                Config=self.transfer_config
+            )
+            logger.info(f"File {source_file_name} uploaded to R2: {object_key}")
 
-            os.remove(source_file_name)
-            logger.info(f"Local file {source_file_name} deleted after upload")
+            remove_file_async(source_file_name)
 
-            return f"{self.public_domain}/{destination_path}"
+            return f"{self.public_domain}/{object_key}"
         except Exception as e:
             logger.error(f"Failed to upload file to R2: {e}")
             raise
@@ -46,15 +128,31 @@ class CloudflareR2Provider(StorageProvider):
         logger.info(f"开始上传二进制数据到R2: {destination_path}")
         logger.debug(f"数据大小: {len(binary_data)} bytes")
 
+        object_key = self._object_key(destination_path)
         try:
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=destination_path,
-                Body=binary_data
-            )
+            extra_args = {'ContentType': _get_content_type(destination_path)}
+            if len(binary_data) < MULTIPART_THRESHOLD:
+                if CRC32C_AVAILABLE:
+                    # 硬件加速的 CRC32C 用于服务端完整性校验
+                    crc = google_crc32c.value(binary_data)
+                    extra_args['ChecksumCRC32C'] = base64.b64encode(crc.to_bytes(4, 'big')).decode()
+                self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=object_key,
+                    Body=binary_data,
+                    **extra_args
+                )
+            else:
+                self.s3_client.upload_fileobj(
+                    BytesIO(binary_data),
+                    self.bucket_name,
+                    object_key,
+                    ExtraArgs=extra_args,
+                    Config=self.transfer_config
+                )
             logger.debug("R2上传完成")
 
-            url = f"{self.public_domain}/{destination_path}"
+            url = f"{self.public_domain}/{object_key}"
             logger.info(f"R2上传成功: {url}")
             return url
         except Exception as e:
@@ -64,10 +162,27 @@ class CloudflareR2Provider(StorageProvider):
 
     def upload_base64(self, base64_data: str, destination_path: str) -> str:
         """上传base64数据到Cloudflare R2"""
+        object_key = self._object_key(destination_path)
         try:
-            import base64
-            file_data = base64.b64decode(base64_data)
-            return self.upload_binary(file_data, destination_path)
+            file_obj = decode_base64_to_buffer(base64_data)
+            self.s3_client.upload_fileobj(
+                file_obj,
+                self.bucket_name,
+                object_key,
+                ExtraArgs={'ContentType': _get_content_type(destination_path)},
+                Config=self.transfer_config
+            )
+
+            url = f"{self.public_domain}/{object_key}"
+            logger.info(f"Base64 data uploaded to R2: {url}")
+            return url
         except Exception as e:
             logger.error(f"Failed to upload base64 data to R2: {e}")
-            raise
\ No newline at end of file
+            raise
+
+
+@lru_cache(maxsize=8)
+def get_r2_provider(bucket_name: str, account_id: str, access_key: str, secret_key: str, public_domain: str = None,
+                    shard_keys: bool = False) -> CloudflareR2Provider:
+    """按配置缓存 Cloudflare R2 提供商实例，避免重复创建客户端"""
+    return CloudflareR2Provider(bucket_name, account_id, access_key, secret_key, public_domain, shard_keys)
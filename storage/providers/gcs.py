@@ -1,25 +1,54 @@
 """
 Google Cloud Storage 存储提供商
 """
-import os
 import logging
+from functools import lru_cache
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from ..base import StorageProvider
+from typing import List, Tuple
+from ..base import MAX_ASYNC_UPLOADS, StorageProvider
+from ..codec import decode_base64_to_buffer
+from ..cleanup import remove_file_async
 
 
 logger = logging.getLogger(__name__)
 
+# 批量上传的工作线程数
+BULK_UPLOAD_WORKERS = 16
+
+# HTTP 连接池大小，不低于异步上传并发数和批量上传线程数
+CONNECTION_POOL_SIZE = max(MAX_ASYNC_UPLOADS, BULK_UPLOAD_WORKERS)
+
+
+# 上传重试由 google-cloud-storage 自带的 DEFAULT_RETRY 处理，上层不再叠加重试
+def _create_client():
+    """创建 GCS 客户端，并按并发度扩大底层 HTTP 连接池"""
+    import requests
+    from google.cloud import storage
+
+    client = storage.Client()
+    # 启用 mTLS 时会话已挂载带客户端证书的适配器，不能替换
+    if not getattr(client._http, 'is_mtls', False):
+        adapter = requests.adapters.HTTPAdapter(pool_connections=CONNECTION_POOL_SIZE, pool_maxsize=CONNECTION_POOL_SIZE)
+        client._http.mount('https://', adapter)
+    return client
+
 
 class GCSProvider(StorageProvider):
     """Google Cloud Storage 提供商"""
 
     def __init__(self, bucket_name: str, cdn_url: str = None):
         try:
-            from google.cloud import storage
-            self.client = storage.Client()
+            self.client = _create_client()
             self.bucket = self.client.bucket(bucket_name)
             self.bucket_name = bucket_name
             self.cdn_url = cdn_url
+            # 批量上传时每个线程持有独立的 Client，避免共享连接池争用；
+            # 线程池随提供商实例长期存在，使线程内的 Client 能跨批次复用
+            self._thread_local = threading.local()
+            self._bulk_executor = ThreadPoolExecutor(max_workers=BULK_UPLOAD_WORKERS, thread_name_prefix='gcs-bulk-upload')
         except ImportError:
             raise ImportError("google-cloud-storage is required for GCS provider")
 
@@ -45,14 +74,83 @@ class GCSProvider(StorageProvider):
             blob.upload_from_filename(source_file_name)
             logger.info(f"File {source_file_name} uploaded to GCS: {destination_path}")
 
-            os.remove(source_file_name)
-            logger.info(f"Local file {source_file_name} deleted after upload")
+            remove_file_async(source_file_name)
 
             return self._get_cdn_url(destination_path)
         except Exception as e:
             logger.error(f"Failed to upload file to GCS: {e}")
             raise
 
+    def _get_thread_bucket(self):
+        """获取当前线程独享的 bucket 对象"""
+        bucket = getattr(self._thread_local, 'bucket', None)
+        if bucket is None:
+            bucket = _create_client().bucket(self.bucket_name)
+            self._thread_local.bucket = bucket
+        return bucket
+
+    def _upload_file_in_thread(self, source_file_name: str, destination_path: str) -> str:
+        """在工作线程中上传单个文件"""
+        blob = self._get_thread_bucket().blob(destination_path)
+        blob.upload_from_filename(source_file_name)
+        logger.info(f"File {source_file_name} uploaded to GCS: {destination_path}")
+
+        remove_file_async(source_file_name)
+
+        return self._get_cdn_url(destination_path)
+
+    def bulk_upload(self, files: List[Tuple[str, str]]) -> List[str]:
+        """并发上传多个文件，files 为 (本地路径, 目标路径) 列表，按顺序返回URL"""
+        try:
+            futures = [
+                self._bulk_executor.submit(self._upload_file_in_thread, source_file_name, destination_path)
+                for source_file_name, destination_path in files
+            ]
+            return [future.result() for future in futures]
+        except Exception as e:
+            logger.error(f"Failed to bulk upload files to GCS: {e}")
+            raise
+
+    def _upload_part_in_thread(self, binary_data: bytes, destination_path: str):
+        """在工作线程中上传单个分片"""
+        self._get_thread_bucket().blob(destination_path).upload_from_string(binary_data)
+
+    def bulk_upload_and_compose(self, parts: List[bytes], destination_path: str) -> str:
+        """并发上传多个小分片并合并为单个对象，返回合并后对象的URL"""
+        if not parts:
+            raise ValueError("parts must not be empty")
+
+        temp_prefix = f"tmp/{uuid.uuid4().hex}"
+        temp_paths = [f"{temp_prefix}/{index}" for index in range(len(parts))]
+
+        try:
+            futures = [
+                self._bulk_executor.submit(self._upload_part_in_thread, part, temp_path)
+                for part, temp_path in zip(parts, temp_paths)
+            ]
+            for future in futures:
+                future.result()
+
+            # 单次 compose 最多合并 32 个对象，超出时在目标对象上逐批追加
+            destination_blob = self.bucket.blob(destination_path)
+            sources = [self.bucket.blob(temp_path) for temp_path in temp_paths]
+            destination_blob.compose(sources[:32])
+            for index in range(32, len(sources), 31):
+                destination_blob.compose([destination_blob] + sources[index:index + 31])
+
+            url = self._get_cdn_url(destination_path)
+            logger.info(f"GCS分片合并上传成功: {url} ({len(parts)} parts)")
+            return url
+        except Exception as e:
+            logger.error(f"GCS分片合并上传失败: {str(e)}")
+            raise
+        finally:
+            # 清理失败只记录日志，避免掩盖上传或合并的原始异常
+            try:
+                self.bucket.delete_blobs(temp_paths, on_error=lambda blob: None)
+            except Exception as e:
+                logger.warning(f"⚠️ 清理GCS临时分片失败 {temp_prefix}: {e}")
+
     def upload_binary(self, binary_data: bytes, destination_path: str) -> str:
         """上传二进制数据到GCS"""
         logger.info(f"开始上传二进制数据到GCS: {destination_path}")
@@ -62,7 +160,14 @@ class GCSProvider(StorageProvider):
             blob = self.bucket.blob(destination_path)
             logger.debug(f"创建GCS blob对象: {destination_path}")
 
-            blob.upload_from_string(binary_data)
+            # 大分片减少可续传上传的请求次数，显式 size 时小文件走单次 multipart 上传
+            blob.chunk_size = 16 * 1024 * 1024
+            blob.upload_from_file(
+                BytesIO(binary_data),
+                size=len(binary_data),
+                content_type='application/octet-stream',
+                checksum='crc32c'
+            )
             logger.debug("数据上传完成")
 
             url = self._get_cdn_url(destination_path)
@@ -76,9 +181,7 @@ class GCSProvider(StorageProvider):
     def upload_base64(self, base64_data: str, destination_path: str) -> str:
         """上传base64数据到GCS"""
         try:
-            import base64
-            file_data = base64.b64decode(base64_data)
-            file_obj = BytesIO(file_data)
+            file_obj = decode_base64_to_buffer(base64_data)
 
             blob = self.bucket.blob(destination_path)
             blob.upload_from_file(file_obj, content_type='application/octet-stream')
@@ -89,4 +192,10 @@ class GCSProvider(StorageProvider):
             return url
         except Exception as e:
             logger.error(f"Failed to upload base64 data to GCS: {e}")
-            raise
\ No newline at end of file
+            raise
+
+
+@lru_cache(maxsize=8)
+def get_gcs_provider(bucket_name: str, cdn_url: str = None) -> GCSProvider:
+    """按配置缓存 GCS 提供商实例，避免重复创建客户端"""
+    return GCSProvider(bucket_name, cdn_url=cdn_url)
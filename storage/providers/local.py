@@ -2,17 +2,80 @@
 本地文件系统存储提供商
 """
 import os
+import shutil
 import logging
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterable
 from ..base import StorageProvider
+from ..codec import iter_base64_decode
 
 
 logger = logging.getLogger(__name__)
 
 
+def _write_file(dest_path: Path, binary_data: bytes):
+    """写入完整文件"""
+    with open(dest_path, 'wb') as f:
+        f.write(binary_data)
+
+
+def _write_file_uncached(dest_path: Path, binary_data: bytes):
+    """写入大文件后落盘并释放其页缓存，避免挤出模型文件等热点缓存"""
+    fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(binary_data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+def _iter_file_entries(root: str):
+    """基于 os.scandir 的迭代式目录遍历，复用 DirEntry 缓存的类型信息"""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError as e:
+            logger.warning(f"读取目录失败: {e}")
+
+
+IOV_MAX = os.sysconf('SC_IOV_MAX') if hasattr(os, 'sysconf') else 1024
+
+
+def _writev_all(fd: int, buffers: list) -> int:
+    """使用 os.writev 写入多个缓冲区，处理单次调用的 IOV_MAX 限制和部分写入"""
+    total = 0
+    buffers = [memoryview(buffer) for buffer in buffers if len(buffer)]
+    while buffers:
+        batch = buffers[:IOV_MAX]
+        written = os.writev(fd, batch)
+        total += written
+        # 跳过已完整写入的缓冲区，截断部分写入的缓冲区
+        index = 0
+        while index < len(batch) and written >= len(batch[index]):
+            written -= len(batch[index])
+            index += 1
+        buffers = buffers[index:]
+        if written:
+            buffers[0] = buffers[0][written:]
+    return total
+
+
 class LocalProvider(StorageProvider):
     """本地文件系统存储提供商"""
 
+    # 不低于该大小的数据写入后释放页缓存
+    UNCACHED_WRITE_LIMIT = 256 * 1024 * 1024
+
     def __init__(self, base_path: str = "/workspace/results"):
         """
         初始化本地存储提供商
@@ -40,7 +103,6 @@ class LocalProvider(StorageProvider):
             dest_path.parent.mkdir(parents=True, exist_ok=True)
             
             # 复制文件
-            import shutil
             shutil.copy2(source_path, dest_path)
             
             logger.info(f"文件已复制到本地存储: {source_file_name} -> {dest_path}")
@@ -65,8 +127,10 @@ class LocalProvider(StorageProvider):
             dest_path.parent.mkdir(parents=True, exist_ok=True)
             
             # 写入文件
-            with open(dest_path, 'wb') as f:
-                f.write(binary_data)
+            if len(binary_data) >= self.UNCACHED_WRITE_LIMIT and hasattr(os, 'posix_fadvise'):
+                _write_file_uncached(dest_path, binary_data)
+            else:
+                _write_file(dest_path, binary_data)
             
             logger.info(f"二进制数据已保存到本地: {dest_path} ({len(binary_data)} bytes)")
             return str(dest_path)
@@ -75,18 +139,45 @@ class LocalProvider(StorageProvider):
             logger.error(f"本地文件写入失败: {e}")
             raise
 
+    def upload_binary_iter(self, chunks: Iterable[bytes], destination_path: str) -> str:
+        """将多个数据块直接写入本地文件，无需事先拼接为单个 bytes"""
+        try:
+            dest_path = self.base_path / destination_path
+            
+            # 确保目标目录存在
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            # 向量化写入
+            fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                size = _writev_all(fd, list(chunks))
+            finally:
+                os.close(fd)
+            
+            logger.info(f"二进制数据已保存到本地: {dest_path} ({size} bytes)")
+            return str(dest_path)
+            
+        except Exception as e:
+            logger.error(f"本地文件写入失败: {e}")
+            raise
+
     def upload_base64(self, base64_data: str, destination_path: str) -> str:
         """保存base64数据到本地文件"""
         try:
-            import base64
+            dest_path = self.base_path / destination_path
+            
+            # 确保目标目录存在
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # 处理 data URL 格式
-            if ',' in base64_data:
-                base64_data = base64_data.split(',')[1]
+            # 分块解码并直接写入文件
+            size = 0
+            with open(dest_path, 'wb') as f:
+                for chunk in iter_base64_decode(base64_data):
+                    f.write(chunk)
+                    size += len(chunk)
             
-            # 解码并保存
-            binary_data = base64.b64decode(base64_data)
-            return self.upload_binary(binary_data, destination_path)
+            logger.info(f"Base64数据已保存到本地: {dest_path} ({size} bytes)")
+            return str(dest_path)
             
         except Exception as e:
             logger.error(f"Base64数据保存失败: {e}")
@@ -118,18 +209,24 @@ class LocalProvider(StorageProvider):
             cutoff_time = time.time() - (days * 24 * 60 * 60)
             deleted_count = 0
             
-            for file_path in self.base_path.rglob('*'):
-                if file_path.is_file() and file_path.stat().st_mtime < cutoff_time:
-                    try:
-                        file_path.unlink()
+            for entry in _iter_file_entries(str(self.base_path)):
+                try:
+                    if entry.stat(follow_symlinks=False).st_mtime < cutoff_time:
+                        os.unlink(entry.path)
                         deleted_count += 1
-                        logger.debug(f"已删除过期文件: {file_path}")
-                    except Exception as e:
-                        logger.warning(f"删除文件失败 {file_path}: {e}")
+                        logger.debug(f"已删除过期文件: {entry.path}")
+                except Exception as e:
+                    logger.warning(f"删除文件失败 {entry.path}: {e}")
             
             logger.info(f"清理完成，删除了 {deleted_count} 个过期文件")
             return deleted_count
             
         except Exception as e:
             logger.error(f"文件清理失败: {e}")
-            return 0
\ No newline at end of file
+            return 0
+
+
+@lru_cache(maxsize=8)
+def get_local_provider(base_path: str = "/workspace/results") -> LocalProvider:
+    """按配置缓存本地存储提供商实例"""
+    return LocalProvider(base_path)
@@ -0,0 +1,59 @@
+"""
+上传重试工具 - 对瞬时网络错误和服务端 5xx 进行指数退避重试
+"""
+import time
+import random
+import logging
+from functools import wraps
+
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class UploadHTTPError(Exception):
+    """上传接口返回非成功 HTTP 状态码时抛出，携带状态码供重试判断"""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(f"HTTP {status_code}: {message}")
+        self.status_code = status_code
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """
+    判断异常是否为可重试的瞬时错误，AccessDenied 等客户端错误不重试
+    R2 与 GCS 使用各自 SDK 自带的重试，此处不处理其异常
+    """
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+
+    if isinstance(error, UploadHTTPError):
+        return error.status_code in RETRYABLE_STATUS_CODES
+
+    try:
+        import requests
+        if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            return True
+    except ImportError:
+        pass
+
+    return False
+
+
+def retry_upload(max_attempts: int = 5, initial: float = 0.2, max_delay: float = 8.0):
+    """上传重试装饰器：指数退避 + 抖动，仅重试瞬时错误"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if attempt == max_attempts or not is_retryable_error(e):
+                        raise
+                    delay = min(max_delay, initial * 2 ** (attempt - 1)) + random.uniform(0, initial)
+                    logger.warning(f"⚠️ {func.__name__} 第 {attempt} 次失败，{delay:.2f}s 后重试: {e}")
+                    time.sleep(delay)
+        return wrapper
+    return decorator
@@ -4,16 +4,18 @@ Simple test script for FaceFusion FastAPI handler
 Tests only the core face swap generation functionality
 """
 
-import requests
+import asyncio
+import importlib.util
+import httpx
 import time
 import sys
 
 
-def test_face_swap(base_url: str = "http://localhost:8000", resolution: str = "auto"):
+async def run_face_swap(client: httpx.AsyncClient, resolution: str = "auto"):
     """Test face swap processing
     
     Args:
-        base_url: API base URL
+        client: Shared async HTTP client bound to the API base URL
         resolution: Output resolution (e.g. '512x512', '1024x1024' or 'auto' for original)
     """
     print("🎭 Testing FaceFusion API face swap...")
@@ -33,11 +35,7 @@ def test_face_swap(base_url: str = "http://localhost:8000", resolution: str = "a
     
     try:
         start_time = time.time()
-        response = requests.post(
-            f"{base_url}/process",
-            json=test_data,
-            timeout=300
-        )
+        response = await client.post("/process", json=test_data)
         response.raise_for_status()
         result = response.json()
         
@@ -54,7 +52,7 @@ def test_face_swap(base_url: str = "http://localhost:8000", resolution: str = "a
             
         return result
         
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         print("❌ Request timed out")
         return {"status": "failed", "error": "Timeout"}
     except Exception as e:
@@ -62,22 +60,30 @@ def test_face_swap(base_url: str = "http://localhost:8000", resolution: str = "a
         return {"status": "failed", "error": str(e)}
 
 
+async def run_face_swaps(base_url: str, resolutions: list):
+    """Run face swap tests for all resolutions concurrently over one connection"""
+    # HTTP/2 multiplexes all requests on one connection when h2 is installed
+    http2 = importlib.util.find_spec('h2') is not None
+    async with httpx.AsyncClient(base_url=base_url, http2=http2, timeout=300) as client:
+        return await asyncio.gather(*[run_face_swap(client, resolution) for resolution in resolutions])
+
+
 def main():
     """Main test function"""
     base_url = "http://localhost:8000"
-    resolution = "auto"
+    resolutions = ["auto"]
     
     # Parse command line arguments
     if len(sys.argv) > 1:
         base_url = sys.argv[1]
     if len(sys.argv) > 2:
-        resolution = sys.argv[2]
+        resolutions = sys.argv[2].split(',')
     
     print(f"🔗 Testing API at: {base_url}")
     
     # Check if API is running
     try:
-        response = requests.get(f"{base_url}/")
+        response = httpx.get(f"{base_url}/")
         response.raise_for_status()
         api_info = response.json()
         print(f"✅ API running: {api_info['service']} v{api_info['version']}")
@@ -88,13 +94,15 @@ def main():
     
     # Run face swap test
     print("\n" + "="*50)
-    result = test_face_swap(base_url, resolution)
+    results = asyncio.run(run_face_swaps(base_url, resolutions))
     print("="*50)
-    print(f"Test result: {result['status']}")
+    for resolution, result in zip(resolutions, results):
+        print(f"Test result ({resolution}): {result['status']}")
     
     if len(sys.argv) == 1:
-        print("\n💡 Usage: python test_fastapi.py [base_url] [resolution]")
+        print("\n💡 Usage: python test_fastapi.py [base_url] [resolution[,resolution...]]")
         print("   resolution can be 'auto', '512x512', '1024x1024', etc.")
+        print("   pass a comma separated list (e.g. '512x512,1024x1024') to run them concurrently")
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ RunPod Handler 测试脚本
 
 import json
 import logging
+import os
 import time
 
 # 配置日志
@@ -120,7 +121,7 @@ def test_concurrent_requests():
 
         print(f"并发测试任务数量: {len(test_jobs)}")
 
-        # 并发执行（实际是顺序执行，因为 handler 不是异步的）
+        # 顺序执行：handler 通过进程级的 state_manager 传递任务参数，不能在同一进程内并发调用
         start_time = time.time()
         results = []
         for job in test_jobs:
@@ -241,7 +242,6 @@ def run_all_tests():
 
 if __name__ == "__main__":
     # 设置环境变量用于测试
-    import os
     os.environ['DEBUG_MODE'] = 'true'
     os.environ['MAX_CONCURRENCY'] = '2'
 
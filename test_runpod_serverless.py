@@ -4,9 +4,10 @@ RunPod Serverless 端点测试脚本
 用于测试已部署的 RunPod Serverless 端点
 """
 
+import asyncio
 import json
 import time
-import requests
+import aiohttp
 import os
 
 # 配置
@@ -20,6 +21,12 @@ TEST_IMAGES = {
     "target": "https://storage.googleapis.com/mtask_storage/file-detect/20250706/15468408970710616.jpg"
 }
 
+# 所有请求共用的请求头，由共享会话统一携带
+HEADERS = {
+    "Authorization": f"Bearer {RUNPOD_API_KEY}",
+    "Content-Type": "application/json"
+}
+
 
 def test_runpod_endpoint():
     """测试 RunPod Serverless 端点"""
@@ -36,30 +43,28 @@ def test_runpod_endpoint():
     print(f"端点ID: {ENDPOINT_ID}")
     print("=" * 60)
 
-    # 测试1: 同步调用
-    success = test_sync_request()
+    return asyncio.run(run_endpoint_tests())
 
-    # 测试2: 异步调用
-    if success:
-        success = test_async_request()
-
-    # 测试3: 批量调用
-    if success:
-        success = test_batch_requests()
 
-    return success
+async def run_endpoint_tests():
+    """三个测试共用一个会话并同时执行"""
+    timeout = aiohttp.ClientTimeout(total=300)
+    connector = aiohttp.TCPConnector(limit=32)
+    async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout, connector=connector) as session:
+        results = await asyncio.gather(
+            run_sync_request(session),    # 测试1: 同步调用
+            run_async_request(session),   # 测试2: 异步调用
+            run_batch_requests(session)   # 测试3: 批量调用
+        )
+    return all(results)
 
 
-def test_sync_request():
+async def run_sync_request(session):
     """测试同步请求"""
     print("\n📞 测试1: 同步调用")
     print("-" * 40)
 
     url = f"{RUNPOD_API_BASE}/{ENDPOINT_ID}/runsync"
-    headers = {
-        "Authorization": f"Bearer {RUNPOD_API_KEY}",
-        "Content-Type": "application/json"
-    }
 
     payload = {
         "input": {
@@ -75,43 +80,38 @@ def test_sync_request():
 
     try:
         start_time = time.time()
-        response = requests.post(url, headers=headers,
-                                 json=payload, timeout=300)
-        end_time = time.time()
+        async with session.post(url, json=payload) as response:
+            end_time = time.time()
 
-        print(f"响应状态: {response.status_code}")
-        print(f"处理时间: {end_time - start_time:.2f} 秒")
+            print(f"响应状态: {response.status}")
+            print(f"处理时间: {end_time - start_time:.2f} 秒")
 
-        if response.status_code == 200:
-            result = response.json()
-            print(f"响应结果: {json.dumps(result, indent=2)}")
+            if response.status == 200:
+                result = await response.json()
+                print(f"响应结果: {json.dumps(result, indent=2)}")
 
-            if result.get('status') == 'success':
-                print("✅ 同步调用测试成功")
-                return True
+                if result.get('status') == 'success':
+                    print("✅ 同步调用测试成功")
+                    return True
+                else:
+                    print(f"❌ 处理失败: {result.get('error', 'Unknown error')}")
+                    return False
             else:
-                print(f"❌ 处理失败: {result.get('error', 'Unknown error')}")
+                print(f"❌ API 调用失败: {await response.text()}")
                 return False
-        else:
-            print(f"❌ API 调用失败: {response.text}")
-            return False
 
     except Exception as e:
         print(f"❌ 请求异常: {str(e)}")
         return False
 
 
-def test_async_request():
+async def run_async_request(session):
     """测试异步请求"""
     print("\n⏰ 测试2: 异步调用")
     print("-" * 40)
 
     # 启动异步任务
     run_url = f"{RUNPOD_API_BASE}/{ENDPOINT_ID}/run"
-    headers = {
-        "Authorization": f"Bearer {RUNPOD_API_KEY}",
-        "Content-Type": "application/json"
-    }
 
     payload = {
         "input": {
@@ -124,14 +124,12 @@ def test_async_request():
 
     try:
         # 提交任务
-        response = requests.post(
-            run_url, headers=headers, json=payload, timeout=30)
-
-        if response.status_code != 200:
-            print(f"❌ 任务提交失败: {response.text}")
-            return False
+        async with session.post(run_url, json=payload, timeout=aiohttp.ClientTimeout(total=30)) as response:
+            if response.status != 200:
+                print(f"❌ 任务提交失败: {await response.text()}")
+                return False
 
-        run_result = response.json()
+            run_result = await response.json()
         job_id = run_result.get('id')
 
         if not job_id:
@@ -145,34 +143,36 @@ def test_async_request():
 
         max_wait_time = 300  # 最多等待5分钟
         start_time = time.time()
+        delay = 0.5  # 轮询间隔，指数退避至最多10秒
 
         while time.time() - start_time < max_wait_time:
-            status_response = requests.get(
-                status_url, headers=headers, timeout=30)
+            async with session.get(status_url, timeout=aiohttp.ClientTimeout(total=30)) as status_response:
+                if status_response.status != 200:
+                    print(f"❌ 状态查询失败: {await status_response.text()}")
+                    return False
 
-            if status_response.status_code == 200:
-                status_result = status_response.json()
-                status = status_result.get('status')
+                status_result = await status_response.json()
 
-                print(f"任务状态: {status}")
+            status = status_result.get('status')
 
-                if status == 'COMPLETED':
-                    output = status_result.get('output', {})
-                    print(f"✅ 异步任务完成: {json.dumps(output, indent=2)}")
-                    return True
-                elif status == 'FAILED':
-                    error = status_result.get('error', 'Unknown error')
-                    print(f"❌ 任务失败: {error}")
-                    return False
-                elif status in ['IN_QUEUE', 'IN_PROGRESS']:
-                    time.sleep(10)  # 等待10秒后重试
-                    continue
-                else:
-                    print(f"❓ 未知状态: {status}")
-                    time.sleep(5)
-            else:
-                print(f"❌ 状态查询失败: {status_response.text}")
+            print(f"任务状态: {status}")
+
+            if status == 'COMPLETED':
+                output = status_result.get('output', {})
+                print(f"✅ 异步任务完成: {json.dumps(output, indent=2)}")
+                return True
+            elif status == 'FAILED':
+                error = status_result.get('error', 'Unknown error')
+                print(f"❌ 任务失败: {error}")
                 return False
+            elif status in ['IN_QUEUE', 'IN_PROGRESS']:
+                await asyncio.sleep(delay)
+                delay = min(delay * 1.7, 10.0)
+                continue
+            else:
+                print(f"❓ 未知状态: {status}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 1.7, 10.0)
 
         print("❌ 任务超时")
         return False
@@ -182,16 +182,12 @@ def test_async_request():
         return False
 
 
-def test_batch_requests():
+async def run_batch_requests(session):
     """测试批量请求"""
     print("\n📦 测试3: 批量调用")
     print("-" * 40)
 
     url = f"{RUNPOD_API_BASE}/{ENDPOINT_ID}/runsync"
-    headers = {
-        "Authorization": f"Bearer {RUNPOD_API_KEY}",
-        "Content-Type": "application/json"
-    }
 
     # 创建3个不同的测试任务
     test_cases = [
@@ -215,40 +211,41 @@ def test_batch_requests():
         }
     ]
 
-    success_count = 0
-    total_time = 0
-
-    for i, test_case in enumerate(test_cases, 1):
-        print(f"\n批量测试 {i}/3 - 分辨率: {test_case['resolution']}")
-
-        payload = {"input": test_case}
-
+    async def _post(index, test_case):
+        """发送单个批量任务，返回 (是否成功, 请求耗时)"""
+        print(f"\n批量测试 {index}/{len(test_cases)} - 分辨率: {test_case['resolution']}")
+        start_time = time.time()
         try:
-            start_time = time.time()
-            response = requests.post(
-                url, headers=headers, json=payload, timeout=300)
-            end_time = time.time()
-
-            request_time = end_time - start_time
-            total_time += request_time
-
-            if response.status_code == 200:
-                result = response.json()
+            async with session.post(url, json={"input": test_case}) as response:
+                request_time = time.time() - start_time
+                if response.status != 200:
+                    print(f"❌ 测试 {index} API 失败: {response.status}")
+                    return False, request_time
+                result = await response.json()
                 if result.get('status') == 'success':
-                    print(f"✅ 测试 {i} 成功 ({request_time:.2f}s)")
-                    success_count += 1
-                else:
-                    print(f"❌ 测试 {i} 处理失败: {result.get('error', 'Unknown')}")
-            else:
-                print(f"❌ 测试 {i} API 失败: {response.status_code}")
-
+                    print(f"✅ 测试 {index} 成功 ({request_time:.2f}s)")
+                    return True, request_time
+                print(f"❌ 测试 {index} 处理失败: {result.get('error', 'Unknown')}")
+                return False, request_time
         except Exception as e:
-            print(f"❌ 测试 {i} 异常: {str(e)}")
+            print(f"❌ 测试 {index} 异常: {str(e)}")
+            return False, time.time() - start_time
+
+    # 所有任务同时发出，总耗时约等于最慢的单个任务
+    start_time = time.time()
+    outcomes = await asyncio.gather(*[
+        _post(i, test_case) for i, test_case in enumerate(test_cases, 1)
+    ])
+    wall_time = time.time() - start_time
+
+    success_count = sum(1 for success, _ in outcomes if success)
+    total_time = sum(request_time for _, request_time in outcomes)
 
     print(f"\n📊 批量测试结果:")
     print(f"成功: {success_count}/{len(test_cases)}")
     print(f"总时间: {total_time:.2f}s")
     print(f"平均时间: {total_time / len(test_cases):.2f}s")
+    print(f"并发墙钟时间: {wall_time:.2f}s")
 
     return success_count == len(test_cases)
 
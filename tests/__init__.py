@@ -0,0 +1,5 @@
+import os
+
+# limit blas thread pools before numpy and onnxruntime get imported by the tests
+os.environ.setdefault('OMP_NUM_THREADS', '1')
+os.environ.setdefault('OPENBLAS_NUM_THREADS', '1')
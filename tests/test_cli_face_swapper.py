@@ -1,5 +1,6 @@
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -10,12 +11,18 @@ from .helper import get_test_example_file, get_test_examples_directory, get_test
 
 @pytest.fixture(scope = 'module', autouse = True)
 def before_all() -> None:
-	conditional_download(get_test_examples_directory(),
-	[
-		'https://github.com/facefusion/facefusion-assets/releases/download/examples-3.0.0/source.jpg',
-		'https://github.com/facefusion/facefusion-assets/releases/download/examples-3.0.0/target-240p.mp4'
-	])
-	subprocess.run([ 'ffmpeg', '-i', get_test_example_file('target-240p.mp4'), '-vframes', '1', get_test_example_file('target-240p.jpg') ])
+	with ThreadPoolExecutor() as executor:
+		source_future = executor.submit(conditional_download, get_test_examples_directory(),
+		[
+			'https://github.com/facefusion/facefusion-assets/releases/download/examples-3.0.0/source.jpg'
+		])
+		conditional_download(get_test_examples_directory(),
+		[
+			'https://github.com/facefusion/facefusion-assets/releases/download/examples-3.0.0/target-240p.mp4'
+		])
+		process = subprocess.Popen([ 'ffmpeg', '-i', get_test_example_file('target-240p.mp4'), '-vframes', '1', get_test_example_file('target-240p.jpg') ])
+		source_future.result()
+	process.wait()
 
 
 @pytest.fixture(scope = 'function', autouse = True)
@@ -1,7 +1,7 @@
 from shutil import which
 
 from facefusion import metadata
-from facefusion.curl_builder import chain, head, run
+from facefusion.curl_builder import chain, head, run, set_max_filesize
 
 
 def test_run() -> None:
@@ -12,3 +12,4 @@ def test_run() -> None:
 
 def test_chain() -> None:
 	assert chain(head(metadata.get('url'))) == [ '-I', metadata.get('url') ]
+	assert chain(head(metadata.get('url')), set_max_filesize(1024)) == [ '-I', metadata.get('url'), '--max-filesize', '1024' ]
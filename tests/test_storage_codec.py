@@ -0,0 +1,34 @@
+import base64
+
+from storage.codec import decode_base64_to_buffer, iter_base64_decode
+
+DATA = bytes(range(256)) * 64
+ENCODED = base64.b64encode(DATA).decode()
+
+
+def test_iter_base64_decode() -> None:
+	assert b''.join(iter_base64_decode(ENCODED)) == DATA
+	assert b''.join(iter_base64_decode('')) == b''
+
+
+def test_iter_base64_decode_with_data_url() -> None:
+	assert b''.join(iter_base64_decode('data:image/png;base64,' + ENCODED)) == DATA
+
+
+def test_iter_base64_decode_across_chunks() -> None:
+	for chunk_size in [ 4, 6, 1000, 1024 ]:
+		chunks = list(iter_base64_decode(ENCODED, chunk_size))
+
+		assert len(chunks) > 1
+		assert b''.join(chunks) == DATA
+
+
+def test_iter_base64_decode_with_wrapped_input() -> None:
+	lines = [ ENCODED[index:index + 76] for index in range(0, len(ENCODED), 76) ]
+
+	for separator in [ '\n', '\r\n', '\r', '\t', ' ' ]:
+		assert b''.join(iter_base64_decode(separator.join(lines), 1000)) == DATA
+
+
+def test_decode_base64_to_buffer() -> None:
+	assert decode_base64_to_buffer(ENCODED).read() == DATA
@@ -0,0 +1,111 @@
+import os
+import tempfile
+
+import pytest
+import requests
+
+import storage.download
+from storage.download import download_parallel
+
+CONTENT = bytes(range(256)) * 4
+
+
+class FakeResponse:
+	def __init__(self, status_code : int, body : bytes, headers : dict) -> None:
+		self.status_code = status_code
+		self.body = body
+		self.headers = headers
+
+	def __enter__(self) -> 'FakeResponse':
+		return self
+
+	def __exit__(self, *args) -> None:
+		pass
+
+	def raise_for_status(self) -> None:
+		if self.status_code >= 400:
+			raise requests.HTTPError(self.status_code)
+
+	def iter_content(self, chunk_size : int):
+		for index in range(0, len(self.body), chunk_size):
+			yield self.body[index:index + chunk_size]
+
+
+class FakeSession:
+	def __init__(self, supports_range : bool = True, probe_error : bool = False) -> None:
+		self.supports_range = supports_range
+		self.probe_error = probe_error
+		self.requests = []
+
+	def __enter__(self) -> 'FakeSession':
+		return self
+
+	def __exit__(self, *args) -> None:
+		pass
+
+	def mount(self, prefix : str, adapter : requests.adapters.HTTPAdapter) -> None:
+		pass
+
+	def get(self, url : str, headers : dict = None, stream : bool = False, timeout : int = None) -> FakeResponse:
+		range_header = (headers or {}).get('Range')
+		self.requests.append(range_header)
+
+		if range_header and self.probe_error:
+			raise requests.ConnectionError()
+		if range_header and self.supports_range:
+			start, end = map(int, range_header.removeprefix('bytes=').split('-'))
+			return FakeResponse(206, CONTENT[start:end + 1], { 'Content-Range': 'bytes ' + str(start) + '-' + str(end) + '/' + str(len(CONTENT)) })
+		return FakeResponse(200, CONTENT, {})
+
+
+@pytest.fixture(scope = 'function')
+def dest_path() -> str:
+	with tempfile.TemporaryDirectory() as temp_directory:
+		yield os.path.join(temp_directory, 'download.bin')
+
+
+def read_file(file_path : str) -> bytes:
+	with open(file_path, 'rb') as file:
+		return file.read()
+
+
+def use_session(monkeypatch : pytest.MonkeyPatch, session : FakeSession) -> None:
+	monkeypatch.setattr(storage.download, 'CHUNK_SIZE', 64)
+	monkeypatch.setattr(requests, 'Session', lambda: session)
+
+
+def test_download_parallel_splits_ranges(monkeypatch : pytest.MonkeyPatch, dest_path : str) -> None:
+	session = FakeSession()
+	use_session(monkeypatch, session)
+
+	assert download_parallel('https://example.com/file', dest_path, parts = 4) == dest_path
+	assert read_file(dest_path) == CONTENT
+	assert session.requests[0] == 'bytes=0-0'
+	assert sorted(session.requests[1:]) == [ 'bytes=0-255', 'bytes=256-511', 'bytes=512-767', 'bytes=768-1023' ]
+
+
+def test_download_parallel_falls_back_for_small_files(monkeypatch : pytest.MonkeyPatch, dest_path : str) -> None:
+	session = FakeSession()
+	use_session(monkeypatch, session)
+
+	assert download_parallel('https://example.com/file', dest_path, parts = 32) == dest_path
+	assert read_file(dest_path) == CONTENT
+	assert session.requests == [ 'bytes=0-0', None ]
+
+
+def test_download_parallel_falls_back_on_probe_error(monkeypatch : pytest.MonkeyPatch, dest_path : str) -> None:
+	session = FakeSession(probe_error = True)
+	use_session(monkeypatch, session)
+
+	assert download_parallel('https://example.com/file', dest_path, parts = 4) == dest_path
+	assert read_file(dest_path) == CONTENT
+	assert session.requests == [ 'bytes=0-0', None ]
+
+
+def test_download_parallel_reuses_full_response(monkeypatch : pytest.MonkeyPatch, dest_path : str) -> None:
+	session = FakeSession(supports_range = False)
+	use_session(monkeypatch, session)
+
+	assert download_parallel('https://example.com/file', dest_path, parts = 4) == dest_path
+	assert read_file(dest_path) == CONTENT
+	assert session.requests == [ 'bytes=0-0' ]
@@ -0,0 +1,48 @@
+import os
+import tempfile
+
+import pytest
+
+import storage.providers.local
+from storage.providers.local import _writev_all
+
+
+@pytest.fixture(scope = 'function')
+def temp_file_path() -> str:
+	file_descriptor, file_path = tempfile.mkstemp()
+	os.close(file_descriptor)
+	yield file_path
+	os.remove(file_path)
+
+
+def write_file(file_path : str, buffers : list) -> int:
+	file_descriptor = os.open(file_path, os.O_WRONLY | os.O_TRUNC)
+
+	try:
+		return _writev_all(file_descriptor, buffers)
+	finally:
+		os.close(file_descriptor)
+
+
+def read_file(file_path : str) -> bytes:
+	with open(file_path, 'rb') as file:
+		return file.read()
+
+
+def test_writev_all(temp_file_path : str) -> None:
+	buffers = [ b'abc', b'', b'defgh', bytearray(b'ij') ]
+
+	assert write_file(temp_file_path, buffers) == 10
+	assert read_file(temp_file_path) == b'abcdefghij'
+
+
+def test_writev_all_with_partial_writes(temp_file_path : str, monkeypatch : pytest.MonkeyPatch) -> None:
+	def partial_writev(file_descriptor : int, buffers : list) -> int:
+		return os.write(file_descriptor, b''.join(buffers)[:4])
+
+	monkeypatch.setattr(storage.providers.local.os, 'writev', partial_writev)
+	monkeypatch.setattr(storage.providers.local, 'IOV_MAX', 2)
+	buffers = [ b'abc', b'defgh', b'ij', b'k' * 7 ]
+
+	assert write_file(temp_file_path, buffers) == 17
+	assert read_file(temp_file_path) == b'abcdefghij' + b'k' * 7
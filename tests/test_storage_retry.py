@@ -0,0 +1,50 @@
+import pytest
+
+import storage.retry
+from storage.retry import UploadHTTPError, is_retryable_error, retry_upload
+
+
+def test_is_retryable_error() -> None:
+	assert is_retryable_error(ConnectionError()) is True
+	assert is_retryable_error(TimeoutError()) is True
+	assert is_retryable_error(UploadHTTPError(429, 'Too Many Requests')) is True
+	assert is_retryable_error(UploadHTTPError(503, 'Service Unavailable')) is True
+	assert is_retryable_error(UploadHTTPError(403, 'Forbidden')) is False
+	assert is_retryable_error(ValueError()) is False
+	assert is_retryable_error(Exception('HTTP 503')) is False
+
+
+def test_retry_upload(monkeypatch : pytest.MonkeyPatch) -> None:
+	monkeypatch.setattr(storage.retry.time, 'sleep', lambda delay: None)
+	errors = [ UploadHTTPError(503, 'Service Unavailable'), ConnectionError() ]
+
+	@retry_upload()
+	def upload() -> str:
+		if errors:
+			raise errors.pop(0)
+		return 'url'
+
+	assert upload() == 'url'
+
+
+def test_retry_upload_gives_up(monkeypatch : pytest.MonkeyPatch) -> None:
+	monkeypatch.setattr(storage.retry.time, 'sleep', lambda delay: None)
+	attempts = []
+
+	@retry_upload(max_attempts = 3)
+	def upload_transient() -> None:
+		attempts.append(1)
+		raise UploadHTTPError(500, 'Internal Server Error')
+
+	@retry_upload()
+	def upload_forbidden() -> None:
+		attempts.append(1)
+		raise UploadHTTPError(403, 'Forbidden')
+
+	with pytest.raises(UploadHTTPError):
+		upload_transient()
+	assert len(attempts) == 3
+
+	with pytest.raises(UploadHTTPError):
+		upload_forbidden()
+	assert len(attempts) == 4